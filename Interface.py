@@ -1,18 +1,48 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from rapidfuzz import process, fuzz
+import os
 import re
+from functools import lru_cache
+
+_SUFFIX_RE = re.compile(r'\s+(?:Jr\.|Sr\.|II|III)$')
+
+@lru_cache(maxsize=8192)
+def _strip_suffix_cached(name):
+    return _SUFFIX_RE.sub('', name).strip()
 
 def strip_suffix(name):
     """Remove Jr., Sr., II, III from player names for consistent matching"""
-    if pd.isna(name):
-        return ""
-    return re.sub(r'\s+(Jr\.|Sr\.|II|III)$', '', name).strip()
+    return _strip_suffix_cached(name) if isinstance(name, str) else ""
+
+def _apply_unique(s, fn):
+    """Apply fn once per distinct value of a Series and broadcast the results back"""
+    uniques = s.unique()
+    return s.map(dict(zip(uniques, map(fn, uniques))))
+
+_MATCH_KEY_RE = re.compile(r"[^a-z0-9 ]")
+
+def match_key(name):
+    """Lowercase and drop punctuation so names can be compared with processor=None"""
+    return _MATCH_KEY_RE.sub("", name.lower()) if isinstance(name, str) else ""
+
+MIN_MATCH_KEY_LEN = 5
 
-# def fuzzy_match_names(name, choices, limit=1, score_cutoff=80):
-#     """Return best fuzzy match from a list of choices"""
-#     results = process.extract(name, choices, scorer=fuzz.token_sort_ratio, limit=limit, score_cutoff=score_cutoff)
-#     return results[0][0] if results else None
+def fuzzy_match_row(name, choices, score_cutoff=90, margin=5):
+    """
+    Return the row position of the one clear fuzzy match for a typed name, or None.
+    `choices` maps row positions to keys built with match_key. Short names and
+    names whose top two scores are within `margin` of each other match nothing.
+    """
+    query = match_key(strip_suffix(name))
+    if len(query) < MIN_MATCH_KEY_LEN:
+        return None
+    hits = process.extract(query, choices, scorer=fuzz.token_sort_ratio, processor=None,
+                           score_cutoff=score_cutoff, limit=2)
+    if not hits or (len(hits) > 1 and hits[0][1] - hits[1][1] < margin):
+        return None
+    return hits[0][2]
 
 
 # --- Page config ---
@@ -37,25 +67,29 @@ st.markdown(
 )
 
 # --- Load and clean dataframe ---
-try:
-    df = pd.read_csv("output.csv")
-    cols_to_keep = [
-        'RK', 'TIERS', 'PLAYER NAME', 'TEAM', 'POS', 'BYE',
-        'SOS', 'ECR VS ADP', 'num', 'RK_DIFF', 'handcuff', 'is_rookie',
-        'is_lottery_ticket', 'is_fantasypros_sleeper', 
-    ]
-    df = df[cols_to_keep]
-
-    rename_dict = {
-        'is_rookie':'R',
-        'is_lottery_ticket': 'LT',
-        'is_fantasypros_sleeper': 'SLPR',
-        'num': 'ESPN'
-    }
+RANKINGS_FILE = "output.parquet"
+cols_to_keep = [
+    'RK', 'TIERS', 'PLAYER NAME', 'TEAM', 'POS', 'BYE',
+    'SOS', 'ECR VS ADP', 'num', 'RK_DIFF', 'handcuff', 'is_rookie',
+    'is_lottery_ticket', 'is_fantasypros_sleeper', 
+]
+rename_dict = {
+    'is_rookie':'R',
+    'is_lottery_ticket': 'LT',
+    'is_fantasypros_sleeper': 'SLPR',
+    'num': 'ESPN'
+}
+
+@st.cache_data
+def load_rankings(path, mtime):
+    """Load and trim the rankings file, cached until the file mtime changes"""
+    df = pd.read_parquet(path, columns=cols_to_keep)
+    return df.rename(columns=rename_dict)
 
-    df = df.rename(columns=rename_dict)
+try:
+    df = load_rankings(RANKINGS_FILE, os.path.getmtime(RANKINGS_FILE))
 except FileNotFoundError:
-    st.error("`output.csv` not found. Please ensure the file is in the same directory.")
+    st.error("`output.parquet` not found. Set SLEEPER_USERNAME in .env and run Ranked_List_Generator.py to create it.")
     st.stop()
 except Exception as e:
     st.error(f"An error occurred while loading the dataframe: {e}")
@@ -63,16 +97,22 @@ except Exception as e:
 
 
 # --- Initialize session state ---
-if "df_filtered" not in st.session_state:
-    st.session_state.df_filtered = df.copy()
-if "removed_stack" not in st.session_state:
-    st.session_state.removed_stack = []
+# The full dataframe never changes; removals only flip a boolean mask over it
+if "df_all" not in st.session_state:
+    st.session_state.df_all = df
+    st.session_state.df_names_norm = _apply_unique(df["PLAYER NAME"], strip_suffix).str.lower().str.strip()
+    st.session_state.mask = np.ones(len(df), dtype=bool)
+    # Pre-normalized keys for draft-day fuzzy lookups (positions match df_all rows)
+    st.session_state.match_keys = [match_key(name) for name in st.session_state.df_names_norm]
+if "mask_stack" not in st.session_state:
+    st.session_state.mask_stack = []
 
 # --- Callback function to handle player removal ---
 def remove_players_callback():
     """Parses user input and removes players from the dataframe using normalized names."""
     user_input = st.session_state.user_input_key
     names_to_remove = []
+    typed_names = []
     lines = user_input.splitlines()
     
     for line in lines:
@@ -84,24 +124,31 @@ def remove_players_callback():
             names_to_remove.append(line.split("/")[0].strip())
         # elif ',' in line:
         #     names_to_remove.extend(name.strip() for name in line.split(","))
-        # # else:
-        # #     names_to_remove.append(line)
+        else:
+            typed_names.append(line)
     
     # Strip suffixes from user input
     names_to_remove = [strip_suffix(n) for n in names_to_remove]
 
     print(names_to_remove)
     
-    # Strip suffixes from dataframe names
-    df_names_normalized = st.session_state.df_filtered["PLAYER NAME"].apply(strip_suffix)
-    
-    # Do removal
-    mask = df_names_normalized.str.lower().isin([n.lower() for n in names_to_remove])
-    removed_rows = st.session_state.df_filtered[mask]
+    # Do removal against the precomputed normalized names (only rows still shown)
+    matches = st.session_state.df_names_norm.isin({n.lower() for n in names_to_remove}).to_numpy(copy=True)
+
+    # Typed names are fuzzy-matched against the players still on the board
+    if typed_names:
+        visible = {i: st.session_state.match_keys[i] for i in np.flatnonzero(st.session_state.mask)}
+        for name in typed_names:
+            row = fuzzy_match_row(name, visible)
+            if row is not None:
+                matches[row] = True
+                names_to_remove.append(st.session_state.df_names_norm.iloc[row])
+
+    to_flip = st.session_state.mask & matches
     
-    if not removed_rows.empty:
-        st.session_state.removed_stack.append(removed_rows)
-        st.session_state.df_filtered = st.session_state.df_filtered[~mask]
+    if to_flip.any():
+        st.session_state.mask_stack.append(to_flip)
+        st.session_state.mask &= ~to_flip
         st.toast(f"Removed: {', '.join([n.title() for n in names_to_remove])}")
     else:
         st.toast("No matching players found.")
@@ -110,11 +157,8 @@ def remove_players_callback():
 
 def undo_removal_callback():
     """Restores the last set of removed players."""
-    if st.session_state.removed_stack:
-        last_removed = st.session_state.removed_stack.pop()
-        st.session_state.df_filtered = pd.concat(
-            [st.session_state.df_filtered, last_removed]
-        ).sort_index()
+    if st.session_state.mask_stack:
+        st.session_state.mask |= st.session_state.mask_stack.pop()
         st.toast("Undo successful!")
     else:
         st.toast("Nothing to undo.")
@@ -123,7 +167,7 @@ def undo_removal_callback():
 # --- Display dataframe ---
 st.title("Fantasy Football Tool")
 st.subheader("Rankings Table")
-st.dataframe(st.session_state.df_filtered, width="content", height=600)
+st.dataframe(st.session_state.df_all.loc[st.session_state.mask], width="content", height=600)
 
 # --- One-click form for removing players with callback ---
 st.subheader("Remove Players")
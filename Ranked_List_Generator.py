@@ -5,9 +5,18 @@ from rapidfuzz import process, fuzz
 import os
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+import orjson
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from contextlib import contextmanager
+from datetime import date, datetime
+import json
 import re
+import time
+from functools import lru_cache
 
 # ===============================
 # Constants
@@ -15,8 +24,39 @@ import re
 load_dotenv()
 print("Loaded SLEEPER_USERNAME:", os.getenv("SLEEPER_USERNAME"))
 
-CSV_FILE = "Input_data/nfl_players.csv"
-DATE_FILE = "Input_data/last_retrieval.txt"
+PARQUET_FILE = "Input_data/nfl_players.parquet"
+ORDERED_FILE = "Input_data/nfl_players_ordered.parquet"
+OUTPUT_FILE = "output.parquet"
+# ETag / Last-Modified of the last players download; freshness comes from the cache mtime
+RETRIEVAL_FILE = "Input_data/last_retrieval.json"
+ACCOUNT_FILE = "Input_data/account_info.json"
+ACCOUNT_TTL_SECONDS = 24 * 60 * 60
+
+# Shared session so repeated Sleeper calls reuse the same connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+REQUEST_TIMEOUT = 30
+
+# Sleeper columns kept by clean_df (in output order); others are never loaded from the cache
+MAIN_COLUMNS = [
+    "player_id", "full_name", "first_name", "last_name", "position", 
+    "team", "team_abbr", "fantasy_positions", "active", "status",
+    "age", "height", "weight", "college", "years_exp",
+    "injury_status", "injury_notes", "injury_body_part",
+    "practice_description", "practice_participation",
+    "birth_city", "birth_state", "birth_country", "birth_date",
+    "team_changed_at"
+]
+
+# Low-cardinality Sleeper columns stored as pandas categoricals
+CATEGORY_COLUMNS = [
+    "position", "team", "team_abbr", "status", "injury_status",
+    "college", "birth_state", "birth_country", "fantasy_positions"
+]
+
+FANTASYPROS_COLUMNS = ["RK", "TIERS", "PLAYER NAME", "TEAM", "POS", "BYE", "SOS", "ECR VS ADP"]
+
+_SUFFIX_RE = re.compile(r'\s+(?:Jr\.|Sr\.|II|III)$')
 
 NFL_TEAMS = [
     "Arizona Cardinals","Atlanta Falcons","Baltimore Ravens","Buffalo Bills","Carolina Panthers",
@@ -31,97 +71,190 @@ NFL_TEAMS = [
 # ===============================
 # Utility Functions
 # ===============================
+@lru_cache(maxsize=8192)
+def _strip_suffix_cached(name):
+    return _SUFFIX_RE.sub('', name).strip()
+
 def strip_suffix(name):
     """Remove Jr., Sr., II, III from player names for consistent matching"""
-    if pd.isna(name):
-        return ""
-    return re.sub(r'\s+(Jr\.|Sr\.|II|III)$', '', name).strip()
-
-def fuzzy_match_names(name, choices, limit=1, score_cutoff=80):
-    """Return best fuzzy match from a list of choices"""
-    results = process.extract(name, choices, scorer=fuzz.token_sort_ratio, limit=limit, score_cutoff=score_cutoff)
-    return results[0][0] if results else None
+    return _strip_suffix_cached(name) if isinstance(name, str) else ""
+
+@contextmanager
+def _atomic_path(path):
+    """Yield a temp path to write to, then atomically move it over `path`"""
+    tmp = path + ".tmp"
+    try:
+        yield tmp
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+def _is_stale(path, source_path):
+    """True if `path` is missing or older than `source_path`"""
+    return not os.path.exists(path) or not os.path.exists(source_path) \
+        or os.path.getmtime(source_path) > os.path.getmtime(path)
+
+def _apply_unique(s, fn):
+    """Apply fn once per distinct value of a Series and broadcast the results back"""
+    uniques = s.unique()
+    return s.map(dict(zip(uniques, map(fn, uniques))))
+
+def _norm(name):
+    """strip_suffix + lowercase for a single player name"""
+    return strip_suffix(name).lower().strip()
+
+def normalize_names(names):
+    """Vectorized strip_suffix + lowercase for a Series of player names"""
+    # Pass the pattern string (not the compiled object) so Arrow-backed strings use their native kernel
+    return names.fillna("").str.replace(_SUFFIX_RE.pattern, "", regex=True).str.lower().str.strip()
+
+def best_fuzzy_matches(names, choices, score_cutoff=80):
+    """Return the best match (or None) in `choices` for every name, using all cores"""
+    # Score every name/choice pair in one batched, multithreaded call
+    scores = process.cdist(names, choices, scorer=fuzz.token_sort_ratio,
+                           score_cutoff=score_cutoff, workers=-1, dtype=np.uint8)
+    best = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(names)), best]
+    return np.where(best_scores >= score_cutoff, np.asarray(choices, dtype=object)[best], None)
 
 # ===============================
 # Data Retrieval
 # ===============================
+def _load_json(path):
+    """Read a small JSON cache file, returning {} if missing or unreadable"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_json(path, data):
+    with _atomic_path(path) as tmp, open(tmp, "w") as f:
+        json.dump(data, f)
+
 def get_account_information():
     username = os.getenv("SLEEPER_USERNAME")
     if not username:
         raise Exception("SLEEPER_USERNAME not set in .env")
+
+    cached = _load_json(ACCOUNT_FILE)
+    if cached.get("username") == username and time.time() - cached.get("fetched_at", 0) < ACCOUNT_TTL_SECONDS:
+        data = cached["data"]
+        print(f"📂 Account loaded from cache: {data.get('display_name')} ({data.get('user_id')})")
+        return data
     
     url = f"https://api.sleeper.app/v1/user/{username}"
-    response = requests.get(url)
-
-    if response.status_code == 200:
+    # Closing the response hands the connection straight back to the pool
+    with SESSION.get(url, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
         data = response.json()
-        print(f"✅ Account loaded: {data.get('display_name')} ({data.get('user_id')})")
-        return data
-    else:
-        raise Exception(f"Error retrieving account: {response.status_code}")
 
+    _save_json(ACCOUNT_FILE, {"username": username, "fetched_at": time.time(), "data": data})
+    print(f"✅ Account loaded: {data.get('display_name')} ({data.get('user_id')})")
+    return data
+
+@lru_cache(maxsize=1)
 def get_updated_player_data():
-    """Fetch NFL player data from Sleeper API, caching daily to CSV"""
-    if os.path.exists(CSV_FILE) and os.path.exists(DATE_FILE):
-        with open(DATE_FILE, "r") as f:
-            last_date = f.read().strip()
-        today = datetime.today().strftime("%Y-%m-%d")
-        if last_date == today:
-            print("📂 Loading player data from saved CSV...")
-            return pd.read_csv(CSV_FILE)
+    """
+    Fetch NFL player data from Sleeper API, caching daily to Parquet.
+
+    Memoized per process; the returned DataFrame is shared, so copy before
+    mutating it. Call get_updated_player_data.cache_clear() to force a reload.
+    """
+    return _get_updated_player_data_impl()
+
+def _get_updated_player_data_impl():
+    try:
+        cached_on = datetime.fromtimestamp(os.stat(PARQUET_FILE).st_mtime).date()
+    except FileNotFoundError:
+        cached_on = None
+    if cached_on == date.today():
+        print("📂 Loading player data from saved Parquet...")
+        return pd.read_parquet(PARQUET_FILE, columns=MAIN_COLUMNS)
 
     print("🌐 Fetching player data from Sleeper API...")
     url = "https://api.sleeper.app/v1/players/nfl"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"API request failed: {response.status_code}")
+    # Conditional request: the server answers 304 if the data hasn't changed
+    retrieval = _load_json(RETRIEVAL_FILE) if cached_on else {}
+    headers = {}
+    if retrieval.get("etag"):
+        headers["If-None-Match"] = retrieval["etag"]
+    if retrieval.get("last_modified"):
+        headers["If-Modified-Since"] = retrieval["last_modified"]
+    with SESSION.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        if response.status_code == 304:
+            print("📂 Player data unchanged, loading saved Parquet...")
+            os.utime(PARQUET_FILE)  # mark the cache fresh for the rest of today
+            return pd.read_parquet(PARQUET_FILE, columns=MAIN_COLUMNS)
+        response.raise_for_status()
+
+        # Collect the raw bytes as they arrive and decode once with orjson
+        payload = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            payload.extend(chunk)
     
-    players = response.json()
-    player_list = []
-    for player_id, info in players.items():
-        info['player_id'] = player_id
-        player_list.append(info)
-    
-    df = pd.DataFrame(player_list)
-    df.to_csv(CSV_FILE, index=False)
-
-    with open(DATE_FILE, "w") as f:
-        f.write(datetime.today().strftime("%Y-%m-%d"))
-
-    return df
+    players = orjson.loads(payload)
+    df = pd.DataFrame(list(players.values()))
+    # Records already carry their own player_id: move it to the front rather than
+    # re-inserting it, filling any record that lacks one from its dict key
+    keys = pd.Series(list(players.keys()), index=df.index)
+    player_ids = df.pop("player_id").fillna(keys) if "player_id" in df.columns else keys
+    df.insert(0, "player_id", player_ids)
+    # fantasy_positions arrives as a list; store it as one comma-joined string
+    df["fantasy_positions"] = df["fantasy_positions"].map(lambda x: ",".join(x) if isinstance(x, list) else x)
+    with _atomic_path(PARQUET_FILE) as tmp:
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+
+    _save_json(RETRIEVAL_FILE, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    })
+
+    # Same projection as the cache paths, so callers always get one shape
+    return df[MAIN_COLUMNS]
 
 # ===============================
 # Data Cleaning
 # ===============================
 def clean_df(df, include_defenses=True):
     """Reorder, deduplicate, clean, and optionally filter defenses"""
-    main_columns = [
-        "player_id", "full_name", "first_name", "last_name", "position", 
-        "team", "team_abbr", "fantasy_positions", "active", "status",
-        "age", "height", "weight", "college", "years_exp",
-        "injury_status", "injury_notes", "injury_body_part",
-        "practice_description", "practice_participation",
-        "birth_city", "birth_state", "birth_country", "birth_date",
-        "team_changed_at"
-    ]
+    df_ordered = df[MAIN_COLUMNS].copy()
 
-    final_columns = main_columns + [col for col in df.columns if col not in main_columns]
-    df_ordered = df[main_columns].copy()
+    # Arrow-backed strings for names, categoricals for low-cardinality columns
+    for col in ["full_name", "first_name", "last_name"]:
+        df_ordered[col] = df_ordered[col].astype("string[pyarrow]")
+    for col in CATEGORY_COLUMNS:
+        df_ordered[col] = df_ordered[col].astype("category")
 
     if not include_defenses:
         df_ordered = df_ordered[df_ordered["position"] != "DEF"]
 
-    df_ordered["team_changed_at"] = pd.to_datetime(df_ordered["team_changed_at"], unit='s', errors='coerce')
+    # Epoch seconds -> datetime via a plain float multiply instead of the generic parser
+    seconds = pd.to_numeric(df_ordered["team_changed_at"], errors='coerce')
+    df_ordered["team_changed_at"] = seconds.astype("float64").mul(1e9).astype("datetime64[ns]")
 
-    # Sort by full_name + most recent update and drop duplicates
-    df_sorted = df_ordered.sort_values(["full_name", "team_changed_at"], ascending=[True, False])
-    df_unique = df_sorted.drop_duplicates(subset="full_name", keep="first").copy()
+    # Keep the most recently updated row per full_name (hash groupby, no full sort)
+    changed_at = df_ordered["team_changed_at"].fillna(pd.Timestamp(0))
+    keep_idx = changed_at.groupby(df_ordered["full_name"], sort=False, dropna=False).idxmax()
+    df_unique = df_ordered.loc[keep_idx].copy()
 
     # Add cleaned name for merging (normalized)
-    df_unique.loc[:, "full_name_clean"] = df_unique["full_name"].apply(strip_suffix).str.lower().str.strip()
-
-    df_unique.to_csv("Input_data/nfl_players_ordered.csv", index=False)
-    print("💾 Saved nfl_players_ordered.csv (deduplicated & cleaned)")
+    df_unique["full_name_clean"] = normalize_names(df_unique["full_name"]).astype("string[pyarrow]")
+
+    # Only rewrite the snapshot when the raw player cache is newer than it or it
+    # was built with a different include_defenses setting (stored in its schema metadata)
+    defenses_flag = str(include_defenses).encode()
+    snapshot_flag = None if _is_stale(ORDERED_FILE, PARQUET_FILE) \
+        else (pq.read_schema(ORDERED_FILE).metadata or {}).get(b"include_defenses")
+    if snapshot_flag != defenses_flag:
+        # Columns are already in output order; hand the frame straight to pyarrow
+        table = pa.Table.from_pandas(df_unique, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"include_defenses": defenses_flag})
+        with _atomic_path(ORDERED_FILE) as tmp:
+            pq.write_table(table, tmp, compression="zstd")
+        print("💾 Saved nfl_players_ordered.parquet (deduplicated & cleaned)")
 
     return df_unique
 
@@ -130,19 +263,24 @@ def clean_df(df, include_defenses=True):
 # ===============================
 def join_to_get_ranked_order(df_left, df_right):
     # Clean and normalize names
-    df_left["PLAYER NAME_CLEAN"] = df_left["PLAYER NAME"].apply(strip_suffix).str.lower().str.strip()
-    df_right_names = df_right["full_name_clean"].tolist()
+    df_left["PLAYER NAME_CLEAN"] = normalize_names(df_left["PLAYER NAME"])
+    left_names = df_left["PLAYER NAME_CLEAN"].tolist()
+    right_names = df_right["full_name_clean"].tolist()
 
-    matched_names = [fuzzy_match_names(name, df_right_names) for name in df_left["PLAYER NAME_CLEAN"]]
-    df_left["Matched Name"] = matched_names
+    # Exact matches first; only the leftovers need fuzzy scoring
+    exact = df_left["PLAYER NAME_CLEAN"].isin(set(right_names)).to_numpy()
+    matched = np.where(exact, np.asarray(left_names, dtype=object), None)
+    unmatched = np.flatnonzero(~exact)
 
-    df_merged = pd.merge(
-        df_left,
-        df_right,
-        how="left",
-        left_on="Matched Name",
-        right_on="full_name_clean"
-    )
+    if len(unmatched):
+        residual = [left_names[i] for i in unmatched]
+        matched[unmatched] = best_fuzzy_matches(residual, right_names)
+    # Merge keys must share a dtype with full_name_clean
+    df_left["Matched Name"] = pd.Series(matched, index=df_left.index, dtype="string[pyarrow]")
+
+    # Index-aligned lookup on the matched name rather than a full merge
+    right_indexed = df_right.set_index("full_name_clean", drop=False)
+    df_merged = df_left.join(right_indexed, on="Matched Name", how="left", rsuffix="_r")
 
     total_rows = len(df_left)
     matched_rows = df_left["Matched Name"].notna().sum()
@@ -156,7 +294,7 @@ def join_check(df_left, df_right, use_fuzzy=True):
     Checks for unmatched names after merging.
 
     If use_fuzzy=True, it relies on the 'Matched Name' column
-    produced by fuzzy matching. Otherwise, it does a direct merge.
+    produced by fuzzy matching. Otherwise, it does a direct name lookup.
     """
     if use_fuzzy:
         if "Matched Name" not in df_left.columns:
@@ -168,90 +306,47 @@ def join_check(df_left, df_right, use_fuzzy=True):
         else:
             print("Unmatched names (fuzzy match):", unmatched_left["PLAYER NAME"].tolist())
     else:
-        # Direct merge check
-        df_left["PLAYER NAME_CLEAN"] = df_left["PLAYER NAME"].apply(strip_suffix)
-        df_merged = pd.merge(
-            df_left,
-            df_right,
-            how="left",
-            left_on="PLAYER NAME_CLEAN",
-            right_on="full_name_clean",
-            indicator=True
-        )
-        unmatched_left = df_merged[df_merged["_merge"] == "left_only"]
-        if len(unmatched_left) == 0:
+        # Direct check: hash lookup of normalized names against the right-side set
+        right_set = set(df_right["full_name_clean"].dropna())
+        left_norm = _apply_unique(df_left["PLAYER NAME"], _norm)
+        unmatched_names = df_left.loc[~left_norm.isin(right_set), "PLAYER NAME"].tolist()
+        if len(unmatched_names) == 0:
             print("🎉 All names matched (exact merge).")
         else:
-            print("Unmatched names (exact merge):", unmatched_left["PLAYER NAME"].tolist())
+            print("Unmatched names (exact merge):", unmatched_names)
 
 # ===============================
 # Add Information
 # ===============================
-def add_is_rookie_col(df):
+def annotate(df, lottery_ticket_names, handcuff_pairs, sleeper_list):
     """
-    Adds a boolean column 'is_rookie' to the dataframe.
-    A player is considered a rookie if years_exp == 0.
+    Adds the rookie, lottery ticket, handcuff and sleeper columns in one pass.
+
+    - 'is_rookie': True if years_exp == 0.
+    - 'is_lottery_ticket': True if the player appears in `lottery_ticket_names`.
+    - 'handcuff': the backup's name for starters in `handcuff_pairs`
+      (list of (starter, handcuff) tuples), NaN for everyone else.
+    - 'is_fantasypros_sleeper': True if the player appears in `sleeper_list`.
     """
     if "years_exp" not in df.columns:
         raise ValueError("Column 'years_exp' not found in dataframe. Did you merge correctly?")
-    
-    df = df.copy()
-    df["is_rookie"] = df["years_exp"].fillna(-1).astype(int) == 0
-    return df
-
-def add_is_lottery_ticket_col(df, lottery_ticket_names):
-    """
-    Adds a boolean column 'is_lottery_ticket' to the dataframe.
-    A player is considered a lottery ticket if their full_name 
-    appears in the provided list `lottery_ticket_names`.
-    """
-    if "full_name" not in df.columns:
-        raise ValueError("Column 'full_name' not found in dataframe.")
-    
-    df = df.copy()
-    # Normalize both df names and provided names for consistency
-    normalized_names = [strip_suffix(name).lower().strip() for name in lottery_ticket_names]
-    df["is_lottery_ticket"] = df["full_name_clean"].isin(normalized_names)
-    return df
-
-def add_handcuff_col(df, handcuff_pairs):
-    """
-    Adds a 'handcuff' column to the dataframe.
-
-    handcuff_pairs: list of tuples
-        Example: [("James Conner", "Trey Benson"), ("Bijan Robinson", "Tyler Allgeier")]
-
-    - If a player is a starter in handcuff_pairs, the 'handcuff' column 
-      will contain the backup's name.
-    - All other players get NaN in the 'handcuff' column.
-    """
-    if "full_name" not in df.columns:
-        raise ValueError("Column 'full_name' not found in dataframe.")
-
-    df = df.copy()
-
-    # Build a lookup map: starter_clean -> handcuff_name
-    handcuff_map = {
-        strip_suffix(starter).lower().strip(): handcuff
-        for starter, handcuff in handcuff_pairs
-    }
-
-    # Assign only to starters
-    df["handcuff"] = df["full_name_clean"].map(handcuff_map)
-
-    return df
-
-def add_fantasypros_sleeper_col(df, sleeper_list):
-    """
-    Adds a boolean column 'is_fantasypros_sleeper' to the dataframe.
-    A player is considered a sleeper if their name appears in sleeper_list.
-    """
     if "full_name_clean" not in df.columns:
         raise ValueError("Column 'full_name_clean' not found. Run clean_df() first.")
 
     df = df.copy()
-    normalized_names = [strip_suffix(name).lower().strip() for name in sleeper_list]
-    df["is_fantasypros_sleeper"] = df["full_name_clean"].isin(normalized_names)
+    # Materialize the name column once and reuse it for every lookup
+    key = df["full_name_clean"]
+    keys = key.to_numpy(dtype=object, na_value="")
+
+    # Normalize provided names once for consistency with full_name_clean
+    lottery = np.fromiter((_norm(name) for name in lottery_ticket_names), dtype=object)
+    sleepers = np.fromiter((_norm(name) for name in sleeper_list), dtype=object)
+    handcuff_map = {_norm(starter): handcuff for starter, handcuff in handcuff_pairs}
+
+    df["is_rookie"] = df["years_exp"].fillna(-1).astype("int8") == 0
+    df["is_lottery_ticket"] = pd.array(np.isin(keys, lottery), dtype="boolean")
+    df["handcuff"] = key.map(handcuff_map)
+    df["is_fantasypros_sleeper"] = pd.array(np.isin(keys, sleepers), dtype="boolean")
     return df
 
 def add_espn_rankings(df_1, df_2):
@@ -283,12 +378,18 @@ if __name__ == "__main__":
     # print(duplicates[["full_name", "team", "position"]])
 
     # Load FantasyPros rankings and filter out NFL team defenses
-    fantasy_pros_rankings_ppr = pd.read_csv("Input_data/FantasyPros_2025_Draft_ALL_Rankings.csv")
-    fantasy_pros_rankings_ppr["PLAYER NAME_CLEAN"] = fantasy_pros_rankings_ppr["PLAYER NAME"].apply(strip_suffix).str.lower().str.strip()
+    # UPSIDE/BUST only hold placeholder text in the export, so they are never parsed
+    fantasy_pros_rankings_ppr = pd.read_csv(
+        "Input_data/FantasyPros_2025_Draft_ALL_Rankings.csv",
+        engine="pyarrow",
+        usecols=FANTASYPROS_COLUMNS,
+        dtype_backend="pyarrow"
+    )
+    fantasy_pros_rankings_ppr["PLAYER NAME_CLEAN"] = normalize_names(fantasy_pros_rankings_ppr["PLAYER NAME"])
     fantasy_pros_rankings_ppr = fantasy_pros_rankings_ppr[~fantasy_pros_rankings_ppr["PLAYER NAME"].isin(NFL_TEAMS)]
 
     # Load ESPN rankings
-    espn_rankings = pd.read_csv("Input_data/ESPN players Order.csv")
+    espn_rankings = pd.read_csv("Input_data/ESPN players Order.csv", engine="pyarrow", dtype_backend="pyarrow")
 
     # Perform fuzzy merge and check unmatched
     lottery_list = [
@@ -380,13 +481,18 @@ if __name__ == "__main__":
     ]
 
     merged = join_to_get_ranked_order(fantasy_pros_rankings_ppr, df_cleaned)
-    merged = add_is_rookie_col(merged)
-    merged = add_is_lottery_ticket_col(merged, lottery_list)
-    merged = add_handcuff_col(merged, handcuffs)
-    merged = add_fantasypros_sleeper_col(merged, sleepers)
+    merged = annotate(merged, lottery_list, handcuffs, sleepers)
     merged = add_espn_rankings(merged, espn_rankings)
-    merged.to_csv("output.csv", index=False)
-    print("output.csv file created!!")
+
+    # Downcast flags and small ints; Parquet keeps these dtypes on reload
+    for col in ["is_rookie", "is_lottery_ticket", "is_fantasypros_sleeper"]:
+        merged[col] = merged[col].astype("boolean")
+    merged["TIERS"] = merged["TIERS"].astype("Int8")
+    merged["RK"] = merged["RK"].astype("Int32")
+    merged["BYE"] = pd.to_numeric(merged["BYE"], errors="coerce").astype("Int8")
+    with _atomic_path(OUTPUT_FILE) as tmp:
+        merged.to_parquet(tmp, engine="pyarrow", compression="zstd")
+    print(f"{OUTPUT_FILE} file created!!")
     print(list(merged.columns))
     join_check(fantasy_pros_rankings_ppr, df_cleaned)
 
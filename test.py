@@ -1,25 +1,43 @@
 import streamlit as st
 import pandas as pd
 
+PAGE_SIZE = 200
+
+@st.cache_data
+def _initial_df():
+    """Build the starting dataframe once; callers get their own copy."""
+    return pd.DataFrame({
+        'col_1': [1, 2, 3],
+        'col_2': ['A', 'B', 'C']
+    })
+
 # --- Initialize dataframe and session state ---
 # This ensures the dataframe persists across reruns.
 # The `if` statement makes sure it's only created once.
 if "df" not in st.session_state:
-    st.session_state.df = pd.DataFrame({
-        'col_1': [1, 2, 3],
-        'col_2': ['A', 'B', 'C']
-    })
+    st.session_state.df = _initial_df().copy()
+# Rows before `head` count as removed; the frame is only rebuilt occasionally
+if "head" not in st.session_state:
+    st.session_state.head = 0
 
 def remove_row():
     """Removes the top row from the dataframe in session state."""
-    if not st.session_state.df.empty:
-        st.session_state.df = st.session_state.df.iloc[1:]
+    if st.session_state.head < len(st.session_state.df):
+        st.session_state.head += 1
+        # Compact once the skipped prefix exceeds 10% of the frame
+        if st.session_state.head > len(st.session_state.df) // 10:
+            st.session_state.df = st.session_state.df.iloc[st.session_state.head:].reset_index(drop=True)
+            st.session_state.head = 0
 
 st.title("Simple Dataframe App")
 
 # --- Display the dataframe ---
 st.subheader("Current Data")
-st.dataframe(st.session_state.df)
+# Only ship one page of rows to the browser per rerun
+view = st.session_state.df.iloc[st.session_state.head:]
+last_page = max(0, (len(view) - 1) // PAGE_SIZE)
+page = st.number_input("Page", min_value=0, max_value=last_page, value=0, step=1)
+st.dataframe(view.iloc[page * PAGE_SIZE:(page + 1) * PAGE_SIZE])
 
 # --- Button to remove the top row ---
 # Now using a callback function for a guaranteed single-click update.
@@ -28,8 +46,6 @@ st.button("Remove Top Row", on_click=remove_row)
 # --- Button to reload/reset the dataframe ---
 # This will restore the dataframe to its initial state
 if st.button("Reset Data"):
-    st.session_state.df = pd.DataFrame({
-        'col_1': [1, 2, 3],
-        'col_2': ['A', 'B', 'C']
-    })
-    st.success("Dataframe reloaded!")
\ No newline at end of file
+    st.session_state.df = _initial_df().copy()
+    st.session_state.head = 0
+    st.success("Dataframe reloaded!")